@@ -12,13 +12,20 @@ Requirements:
     - `ekho` must be installed and available on PATH.
 """
 
-import csv
+import functools
 import os
 import re
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Set
 
+# Add the repository root to path so the shared audio naming can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.common.audio import index_audio_dir, safe_name
+
 
 RESOURCE_DIR = Path('resources')
 CSV_EXT = '.csv'
@@ -42,14 +49,17 @@ def extract_chinese(text: str) -> Set[str]:
     return set(matches)
 
 
+def audio_path(out_dir: Path, text: str) -> Path:
+    """Return the WAV path for text: unsafe characters replaced by underscores."""
+    return out_dir / f"{safe_name(text)}.wav"
+
+
 def make_audio(package: str, text: str, out_dir: Path):
     """Call ekho to generate an audio file for the given text.
 
     Output filename is the text with unsafe characters replaced by underscores.
     """
-    safe_name = ''.join(ch if ch.isalnum() else '_' for ch in text)
-    filename = f"{safe_name}.wav"
-    out_path = out_dir / filename
+    out_path = audio_path(out_dir, text)
     if out_path.exists():
         print(f"Skipping existing: {out_path}")
         return
@@ -82,13 +92,10 @@ def main():
         package_map.setdefault(package, set())
 
         try:
-            with csv_path.open(encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    for val in row.values():
-                        # Extract chinese substrings
-                        found = extract_chinese(val)
-                        package_map[package].update(found)
+            # Scan the whole file at once: separators and newlines are ASCII,
+            # so a match can never span two cells.
+            text = csv_path.read_text(encoding='utf-8')
+            package_map[package].update(extract_chinese(text))
         except Exception as e:
             print('Failed reading', csv_path, e)
 
@@ -100,11 +107,21 @@ def main():
     out_dir = RESOURCE_DIR / 'audio'
     out_dir.mkdir(parents=True, exist_ok=True)
     print(f'Total unique Chinese items: {len(all_texts)}')
-    for text in sorted(all_texts):
-        if not text.strip():
-            continue
-        # package argument unused for single audio directory; pass empty string
-        make_audio('', text, out_dir)
+
+    # Only queue texts that still need audio; list the directory once rather
+    # than stat-ing every candidate file.
+    existing = index_audio_dir(out_dir)
+    pending = [
+        text for text in sorted(all_texts)
+        if text.strip() and safe_name(text) not in existing
+    ]
+    print(f'Missing audio files: {len(pending)}')
+
+    # ekho runs in its own process, so a thread per core keeps that many busy.
+    # package argument unused for single audio directory; pass empty string
+    worker = functools.partial(make_audio, '', out_dir=out_dir)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(worker, pending))
 
 
 if __name__ == '__main__':
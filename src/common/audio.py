@@ -0,0 +1,34 @@
+"""Audio file naming shared by the apps and the TTS generator (common)."""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict
+
+
+AUDIO_DIR = Path('resources') / 'audio'
+
+# Characters replaced by '_' in audio filenames (anything that is not alphanumeric)
+SAFE_RE = re.compile(r'\W')
+
+
+def safe_name(text: str) -> str:
+    """Return the audio filename stem for text."""
+    return SAFE_RE.sub('_', text)
+
+
+def index_audio_dir(audio_dir: Path = AUDIO_DIR) -> Dict[str, Path]:
+    """Map filename stem -> path for every WAV file in audio_dir.
+
+    The directory is read in a single scandir pass, so later existence checks
+    are dict lookups rather than stat calls.
+    """
+    index = {}
+    try:
+        with os.scandir(audio_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.wav') and entry.is_file():
+                    index[entry.name[:-len('.wav')]] = audio_dir / entry.name
+    except FileNotFoundError:
+        pass
+    return index
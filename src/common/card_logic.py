@@ -1,27 +1,54 @@
 """Core logic for flashcard operations (common)."""
 
 import random
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Optional
+
+
+# Fields the user must fill in for each quiz mode (the prompted one is shown)
+_CHECKED_FIELDS = {
+    'char': ('jyut', 'eng'),
+    'jyut': ('char', 'eng'),
+    'eng': ('char', 'jyut'),
+}
+
+# field -> (label, key of the expected value on the word, lowercase the input?)
+_FIELDS = {
+    'char': ("Chinese", 'char', False),
+    'jyut': ("Jyutping", 'jyut_lc', True),
+    'eng': ("English", 'eng_alts', True),
+}
 
 
 class CardLogic:
     """Handles flashcard game logic and answer checking."""
 
-    def __init__(self, words: List[Dict[str, Any]]):
+    def __init__(self, words: List[Dict[str, Any]], indices: Optional[Iterable[int]] = None):
+        """words: all loaded words; indices: the ones to draw from (default: all)."""
         self.words = words
         self.current = None
         self.current_idx = -1
+        self.set_indices(range(len(words)) if indices is None else indices)
+
+    def set_indices(self, indices: Iterable[int]):
+        """Draw only from these word indices, starting a fresh shuffled pass."""
+        # Shuffled draw order: every card comes up once per pass through the deck
+        self._deck = list(indices)
+        random.shuffle(self._deck)
+        self._pos = 0
 
     def get_random_card(self) -> Dict[str, Any]:
-        if not self.words:
+        if not self._deck:
             return None
 
-        self.current_idx = random.randint(0, len(self.words) - 1)
+        if self._pos >= len(self._deck):
+            random.shuffle(self._deck)
+            self._pos = 0
+        self.current_idx = self._deck[self._pos]
+        self._pos += 1
         self.current = self.words[self.current_idx]
         mode = random.choice(['char', 'jyut', 'eng'])
 
         self.current['q'] += 1
-        self.current['_row']['Questioned'] = str(self.current['q'])
 
         return {
             'card': self.current,
@@ -32,35 +59,25 @@ class CardLogic:
         if not self.current:
             return False, "No card loaded"
 
-        c = user_inputs.get('char', '').strip()
-        j = user_inputs.get('jyut', '').strip().lower()
-        e = user_inputs.get('eng', '').strip().lower()
-
-        exp_c = self.current['char']
-        exp_j = self.current['jyut'].lower()
-        exp_e_list = [x.strip() for x in self.current['eng'].split('/')]
-
         correct = True
         msg = [""]
 
-        for tested, answer, expected in [
-            ("Chinese", c, exp_c) if mode != 'char' else (None, None, None),
-            ("Jyutping", j, exp_j) if mode != 'jyut' else (None, None, None),
-            ("English", e, exp_e_list) if mode != 'eng' else (None, None, None),
-        ]:
-            if answer is None:
-                continue
+        for field in _CHECKED_FIELDS[mode]:
+            tested, expected_key, lowercase = _FIELDS[field]
+            answer = user_inputs.get(field, '').strip()
+            if lowercase:
+                answer = answer.lower()
+            expected = self.current[expected_key]
 
             if answer not in expected:
                 correct = False
                 msg.append(f"{tested} : expected {expected if type(expected) is str else ' / '.join(expected)}")
                 break
             else:
-               msg.append(f"{tested} : Correct!")
-    
+                msg.append(f"{tested} : Correct!")
+
         if correct:
             self.current['c'] += 1
-            self.current['_row']['Correct'] = str(self.current['c'])
 
 
         return correct, "\n".join(msg)
@@ -1,19 +1,118 @@
 """Data manager for loading and saving flashcard data (common)."""
 
 import csv
+import heapq
 import os
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional: only used to speed up loading large decks
+    pa = None
+    pa_csv = None
 
 
 REQUIRED_HEADERS = ['Word', 'Jyutping', 'English', 'Questioned', 'Correct', 'Type']
 
+# Files at least this big are parsed with pyarrow when it is installed
+ARROW_MIN_BYTES = 1024 * 1024
+
+
+def to_int(value: str) -> int:
+    """Parse a counter cell, treating blank or non-numeric values as 0."""
+    value = value.strip()
+    return int(value) if value.isdecimal() else 0
+
+
+def read_rows_arrow(csv_file: str, headers: List[str]) -> Optional[Iterator[Tuple[str, ...]]]:
+    """Parse the data rows of csv_file with pyarrow's multithreaded reader.
+
+    Every column is read as a string so rows match what csv.reader yields.
+    Rows are always full width, so they are yielded as tuples without copying.
+    Returns None if pyarrow rejects the file (e.g. a row with too few or too
+    many fields); callers then read it with csv.reader, which tolerates that.
+    """
+    # Memory-map the file so pyarrow parses straight from the page cache
+    try:
+        with pa.memory_map(csv_file) as source:
+            table = pa_csv.read_csv(
+                source,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in headers}
+                ),
+            )
+    except pa.ArrowInvalid:
+        return None
+    columns = [table.column(i).to_pylist() for i in range(table.num_columns)]
+    return zip(*columns)
 
-class DataManager:
-    """Handles loading and saving CSV flashcard data."""
+
+def use_arrow(csv_file: str) -> bool:
+    """True if pyarrow is installed and csv_file is big enough to benefit."""
+    return pa_csv is not None and os.path.getsize(csv_file) >= ARROW_MIN_BYTES
+
+
+class CsvStore:
+    """Dirty tracking and atomic saving shared by the CSV data managers.
+
+    Subclasses provide get_rows() and write_csv(f, rows).
+    """
 
     def __init__(self, csv_file: str):
         self.csv_file = csv_file
+        # True when counters changed since the last save
+        self._dirty = False
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def mark_clean(self):
+        self._dirty = False
+
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def write_rows(self, rows: list) -> bool:
+        """Write rows to a temporary file, then atomically replace the CSV.
+
+        Returns False if the write failed.
+        """
+        tmp_file = self.csv_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+                self.write_csv(f, rows)
+                # make sure the data is on disk before it replaces the old file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.csv_file)
+            return True
+        except Exception as e:
+            print(f"Error saving CSV: {e}")
+            import traceback
+            traceback.print_exc()
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return False
+
+    def save_csv(self):
+        """Write the CSV if anything changed since the last save."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        if not self.write_rows(self.get_rows()):
+            self._dirty = True
+
+
+class DataManager(CsvStore):
+    """Handles loading and saving CSV flashcard data."""
+
+    def __init__(self, csv_file: str):
+        super().__init__(csv_file)
         self.words: List[Dict[str, Any]] = []
+        # type -> indices into self.words, in file order
+        self._type_index: Dict[str, List[int]] = {}
 
     def create_default_csv(self):
         with open(self.csv_file, 'w', encoding='utf-8', newline='') as f:
@@ -28,34 +127,47 @@ class DataManager:
 
         try:
             with open(self.csv_file, encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames != REQUIRED_HEADERS:
+                reader = csv.reader(f)
+                headers = next(reader, [])
+                if headers != REQUIRED_HEADERS:
                     print(f"Warning: CSV headers should be: {', '.join(REQUIRED_HEADERS)}")
+                if not headers:
+                    return True
 
-                for row_idx, row in enumerate(reader):
-                    word = row['Word'].strip() if row['Word'] else ''
-                    if not word:
-                        continue
+                # Resolve column positions once instead of per-row dict lookups
+                col = {name: i for i, name in enumerate(headers)}
+                word_i, jyut_i, eng_i = col['Word'], col['Jyutping'], col['English']
+                q_i, c_i, type_i = col['Questioned'], col['Correct'], col.get('Type')
+                width = len(headers)
+
+                if use_arrow(self.csv_file):
+                    reader = read_rows_arrow(self.csv_file, headers) or reader
 
-                    try:
-                        questioned_val = int(row['Questioned'].strip()) if row['Questioned'] and row['Questioned'].strip().isdigit() else 0
-                    except (ValueError, AttributeError):
-                        questioned_val = 0
+                for row in reader:
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
 
-                    try:
-                        correct_val = int(row['Correct'].strip()) if row['Correct'] and row['Correct'].strip().isdigit() else 0
-                    except (ValueError, AttributeError):
-                        correct_val = 0
+                    word = row[word_i].strip()
+                    if not word:
+                        continue
 
+                    # Interned so the few distinct types share one string object
+                    word_type = sys.intern(row[type_i].strip()) if type_i is not None else ''
+                    jyut = row[jyut_i].strip()
+                    eng = row[eng_i].strip().lower()
                     self.words.append({
                         'char': word,
-                        'jyut': row['Jyutping'].strip() if row['Jyutping'] else '',
-                        'eng': row['English'].strip().lower() if row['English'] else '',
-                        'q': questioned_val,
-                        'c': correct_val,
-                        'type': (row.get('Type') or '').strip(),
-                        '_row': row
+                        'jyut': jyut,
+                        'eng': eng,
+                        'eng_upper': eng.upper(),
+                        # Normalised expected answers, used by CardLogic.check_answer
+                        'jyut_lc': jyut.lower(),
+                        'eng_alts': tuple(x.strip() for x in eng.split('/')),
+                        'q': to_int(row[q_i]),
+                        'c': to_int(row[c_i]),
+                        'type': word_type,
                     })
+                    self._type_index.setdefault(word_type, []).append(len(self.words) - 1)
             return True
         except Exception as e:
             print(f"Error loading CSV: {e}")
@@ -63,29 +175,17 @@ class DataManager:
             traceback.print_exc()
             return False
 
-    def save_csv(self):
-        try:
-            with open(self.csv_file, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=REQUIRED_HEADERS, extrasaction='ignore', restval='')
-                writer.writeheader()
-                for w in self.words:
-                    row = {}
-                    for field in REQUIRED_HEADERS:
-                        value = w['_row'].get(field, '') if w['_row'] else ''
-                        row[field] = value if value is not None else ''
-
-                    row['Word'] = w['char']
-                    row['Jyutping'] = w['jyut']
-                    row['English'] = w['eng'].upper()
-                    row['Questioned'] = str(w['q'])
-                    row['Correct'] = str(w['c'])
-                    row['Type'] = w['type']
-
-                    writer.writerow(row)
-        except Exception as e:
-            print(f"Error saving CSV: {e}")
-            import traceback
-            traceback.print_exc()
+    def get_rows(self) -> List[Tuple[str, ...]]:
+        """Snapshot the current words as CSV rows in REQUIRED_HEADERS order."""
+        return [
+            (w['char'], w['jyut'], w['eng_upper'], str(w['q']), str(w['c']), w['type'])
+            for w in self.words
+        ]
+
+    def write_csv(self, f, rows: List[Tuple[str, ...]]):
+        writer = csv.writer(f)
+        writer.writerow(REQUIRED_HEADERS)
+        writer.writerows(rows)
 
     def get_words(self) -> List[Dict[str, Any]]:
         return self.words
@@ -104,24 +204,20 @@ class DataManager:
         elif mode == 'jyut':
             return word['jyut']
         elif mode == 'eng':
-            return word['eng'].upper()
+            return word['eng_upper']
         return ""
 
     def get_types(self) -> List[str]:
-        types_set = set()
-        for word in self.words:
-            word_type = word.get('type', '').strip()
-            if word_type:
-                types_set.add(word_type)
-        return sorted(list(types_set))
+        return sorted(t for t in self._type_index if t)
 
-    def filter_words_by_types(self, selected_types: List[str]) -> List[Dict[str, Any]]:
+    def filter_indices(self, selected_types: List[str]) -> List[int]:
+        """Return the indices of words whose type is selected, in file order."""
         if not selected_types:
             return []
 
-        filtered = []
-        for word in self.words:
-            word_type = word.get('type', '').strip()
-            if word_type in selected_types:
-                filtered.append(word)
-        return filtered
+        groups = [self._type_index[t] for t in set(selected_types) if t in self._type_index]
+        # Each group is already sorted, so merging keeps file order
+        return list(heapq.merge(*groups))
+
+    def filter_words_by_types(self, selected_types: List[str]) -> List[Dict[str, Any]]:
+        return [self.words[i] for i in self.filter_indices(selected_types)]
@@ -0,0 +1,65 @@
+"""Background worker for writing CSV data off the UI thread (shared)."""
+
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+
+
+SAVE_DELAY_MS = 5000
+
+
+class SaveWorker(QObject):
+    """Writes row snapshots through a data manager; lives in its own QThread."""
+
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+
+    @pyqtSlot(list)
+    def do_save(self, rows: list):
+        if not self.data_manager.write_rows(rows):
+            # keep the changes pending so the next save retries them
+            self.data_manager.mark_dirty()
+
+
+class BackgroundSaver(QObject):
+    """Batches a data manager's saves and hands them to a SaveWorker thread.
+
+    The data manager needs is_dirty/mark_dirty/mark_clean, get_rows and write_rows.
+    """
+
+    save_requested = pyqtSignal(list)
+
+    def __init__(self, data_manager, delay_ms: int = SAVE_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+
+        self.save_thread = QThread(self)
+        self.worker = SaveWorker(data_manager)
+        self.worker.moveToThread(self.save_thread)
+        self.save_requested.connect(self.worker.do_save)
+        self.save_thread.start()
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(delay_ms)
+        self.save_timer.timeout.connect(self.flush)
+
+    def request_save(self):
+        # Write-behind: the first unsaved answer opens a window and everything
+        # answered before it closes goes out in one write
+        if not self.save_timer.isActive():
+            self.save_timer.start()
+
+    def flush(self):
+        if not self.data_manager.is_dirty():
+            return
+        # rows are snapshotted here on the GUI thread; only the write runs in the worker
+        self.data_manager.mark_clean()
+        self.save_requested.emit(self.data_manager.get_rows())
+
+    def stop(self):
+        """Write out any unsaved changes and wait for the worker to finish."""
+        # flush even with no save pending: a draw or a failed write may still be unsaved
+        self.save_timer.stop()
+        self.flush()
+        self.save_thread.quit()
+        self.save_thread.wait()
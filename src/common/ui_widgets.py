@@ -2,38 +2,81 @@
 
 from PyQt5.QtWidgets import QLineEdit, QLabel, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, QGroupBox, QMessageBox
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtMultimedia import QSound
+from PyQt5.QtCore import Qt, QTimer, QUrl, pyqtSignal
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .audio import AUDIO_DIR, safe_name
+
+
+# Number of loaded sound effects kept around for replay
+SOUND_CACHE_SIZE = 50
+
+# Checkbox toggles within this window produce a single filter update
+FILTER_DELAY_MS = 50
 
 
 class InputField(QLineEdit):
     """Custom QLineEdit for flashcard input."""
 
+    # Parsed once per field; Qt switches the look itself when enabled changes
+    STYLE = "QLineEdit:disabled { background-color: #e0e0e0; color: black; }"
+
     def __init__(self, font: QFont = None, height: int = 50, parent=None):
         super().__init__(parent)
         if font:
             self.setFont(font)
         self.setAlignment(Qt.AlignCenter)
         self.setFixedHeight(height)
+        self.setStyleSheet(self.STYLE)
 
     def disable(self, value: str):
         self.setText(value)
         self.setEnabled(False)
-        self.setStyleSheet("background-color: #e0e0e0; color: black;")
 
     def enable(self):
         self.clear()
         self.setEnabled(True)
-        self.setStyleSheet("")
+
+
+class SoundCache:
+    """Plays WAV files, keeping the most recently used ones loaded for replay."""
+
+    def __init__(self, parent: QWidget, size: int = SOUND_CACHE_SIZE):
+        self.parent = parent
+        self.size = size
+        self._effects: "OrderedDict[str, Any]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._effects)
+
+    def play(self, audio_path: Path):
+        key = str(audio_path)
+        effect = self._effects.get(key)
+        if effect is None:
+            # QtMultimedia is only loaded once something is actually played
+            from PyQt5.QtMultimedia import QSoundEffect
+            effect = QSoundEffect(self.parent)
+            effect.setSource(QUrl.fromLocalFile(str(Path(audio_path).absolute())))
+            self._effects[key] = effect
+            if len(self._effects) > self.size:
+                _, oldest = self._effects.popitem(last=False)
+                oldest.deleteLater()
+        else:
+            self._effects.move_to_end(key)
+        effect.play()
 
 
 class CardDisplay(QWidget):
     """Widget for displaying flashcard input fields."""
 
-    def __init__(self, on_check_callback=None, parent=None):
+    def __init__(self, on_check_callback=None, parent=None, audio_index: Optional[Dict[str, Path]] = None):
         super().__init__(parent)
         self.on_check = on_check_callback
+        # stem -> path of known audio files; None means check the disk per click
+        self.audio_index = audio_index
+        self._sound_cache = SoundCache(self)
         self.init_ui()
 
     def init_ui(self):
@@ -100,22 +143,32 @@ class CardDisplay(QWidget):
 
     def get_audio_path(self, text: str) -> Path:
         """Return the expected audio file path for a given Chinese text."""
-        safe_name = ''.join(ch if ch.isalnum() else '_' for ch in text)
-        return Path('resources') / 'audio' / f"{safe_name}.wav"
+        return AUDIO_DIR / f"{safe_name(text)}.wav"
+
+    def find_audio(self, text: str) -> Optional[Path]:
+        """Return the audio file for text, or None if there is none."""
+        if self.audio_index is not None:
+            return self.audio_index.get(safe_name(text))
+        audio_path = self.get_audio_path(text)
+        return audio_path if audio_path.exists() else None
 
     def on_listen_clicked(self):
         text = self.char_input.text().strip()
         if not text:
             return
-        audio_path = self.get_audio_path(text)
-        if not audio_path.exists():
-            QMessageBox.warning(self, "No Audio", f"Audio file not found: {audio_path}")
+        audio_path = self.find_audio(text)
+        if audio_path is None:
+            QMessageBox.warning(self, "No Audio", f"Audio file not found: {self.get_audio_path(text)}")
             return
         try:
-            QSound.play(str(audio_path))
+            self.play_sound(audio_path)
         except Exception as e:
             QMessageBox.warning(self, "Playback Error", f"Failed to play audio: {e}")
 
+    def play_sound(self, audio_path: Path):
+        """Play a WAV file, reusing the already-loaded effect on replays."""
+        self._sound_cache.play(audio_path)
+
     def set_quiz_mode(self, mode: str, card: dict):
         self.reset_inputs()
 
@@ -150,6 +203,12 @@ class TypeFilter(QGroupBox):
         self.types = types
         self.checkboxes = {}
         self.on_filter_changed = on_filter_changed
+
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(FILTER_DELAY_MS)
+        self._emit_timer.timeout.connect(self._emit_selected)
+
         self.init_ui()
 
     def init_ui(self):
@@ -165,9 +224,32 @@ class TypeFilter(QGroupBox):
             layout.addWidget(checkbox)
 
         layout.addStretch()
+
+        btn_all = QPushButton("All")
+        btn_all.clicked.connect(lambda: self.set_all(True))
+        layout.addWidget(btn_all)
+
         self.setLayout(layout)
 
     def on_checkbox_changed(self):
+        # Restarting the timer coalesces a burst of clicks into one update
+        self._emit_timer.start()
+
+    def set_all(self, checked: bool):
+        """Check or uncheck every type, emitting a single filter update if any changed."""
+        changed = False
+        for checkbox in self.checkboxes.values():
+            if checkbox.isChecked() == checked:
+                continue
+            checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(False)
+            changed = True
+        if changed:
+            self._emit_timer.stop()
+            self._emit_selected()
+
+    def _emit_selected(self):
         selected = self.get_selected_types()
         if self.on_filter_changed:
             self.on_filter_changed(selected)
@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QMessageBox
 from ..common.ui_widgets import CardDisplay, ControlButtons, TypeFilter
 from ..common.data_manager import DataManager
 from ..common.card_logic import CardLogic
+from ..common.save_worker import BackgroundSaver
+from ..common.audio import index_audio_dir
 
 
 MAX_CARDS = 10
@@ -17,10 +19,11 @@ class FlashcardApp(QWidget):
         super().__init__()
         self.csv_file = csv_file
         self.data_manager = DataManager(csv_file)
+        self.saver = BackgroundSaver(self.data_manager, parent=self)
         self.card_logic = None
         self.card_count = 0
         self.current_mode = None
-        self.filtered_words = []
+        self.filtered_indices = []
         self.selected_types = []
 
         if not self.data_manager.load_csv():
@@ -37,12 +40,17 @@ class FlashcardApp(QWidget):
             return
 
         self.selected_types = available_types
-        self.filtered_words = self.data_manager.filter_words_by_types(self.selected_types)
+        self.filtered_indices = self.data_manager.filter_indices(self.selected_types)
 
-        self.card_logic = CardLogic(self.filtered_words)
+        self.card_logic = CardLogic(self.data_manager.get_words(), self.filtered_indices)
         self.available_types = available_types
+        self.audio_index = index_audio_dir()
         self.init_ui()
 
+    def closeEvent(self, event):
+        self.saver.stop()
+        super().closeEvent(event)
+
     def init_ui(self):
         self.setWindowTitle("Cantonese Flashcard - Enter to Check")
         self.resize(750, 600)
@@ -51,7 +59,7 @@ class FlashcardApp(QWidget):
             self.available_types,
             on_filter_changed=self.on_filter_changed
         )
-        self.card_display = CardDisplay(on_check_callback=self.check)
+        self.card_display = CardDisplay(on_check_callback=self.check, audio_index=self.audio_index)
         self.buttons = ControlButtons(
             on_check_callback=self.check,
             on_next_callback=self.new_card
@@ -72,13 +80,13 @@ class FlashcardApp(QWidget):
             QMessageBox.warning(self, "No Selection", "Please select at least one card type")
             return
 
-        self.filtered_words = self.data_manager.filter_words_by_types(selected_types)
+        self.filtered_indices = self.data_manager.filter_indices(selected_types)
 
-        if not self.filtered_words:
+        if not self.filtered_indices:
             QMessageBox.warning(self, "No Cards", "No cards available for selected types")
             return
 
-        self.card_logic = CardLogic(self.filtered_words)
+        self.card_logic.set_indices(self.filtered_indices)
         self.card_count = 0
         self.update_title()
         self.new_card()
@@ -93,6 +101,10 @@ class FlashcardApp(QWidget):
             QMessageBox.critical(self, "Error", "Failed to get card")
             return
 
+        # drawing a card bumps its Questioned counter
+        self.data_manager.mark_dirty()
+        self.saver.request_save()
+
         self.current_mode = card_info['mode']
         self.card_display.set_quiz_mode(self.current_mode, card_info['card'])
 
@@ -108,8 +120,10 @@ class FlashcardApp(QWidget):
 
         user_inputs = self.card_display.get_inputs()
         is_correct, message = self.card_logic.check_answer(self.current_mode, user_inputs)
+        if is_correct:
+            self.data_manager.mark_dirty()
 
-        self.data_manager.save_csv()
+        self.saver.request_save()
 
         if is_correct:
             QMessageBox.information(self, "Correct!", message)
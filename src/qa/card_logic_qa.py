@@ -4,6 +4,13 @@ from typing import List, Dict, Any, Tuple
 import random
 
 
+def _matches(a: str, b: str) -> bool:
+    """True if one string contains the other (which includes equality)."""
+    if len(a) > len(b):
+        a, b = b, a
+    return a in b
+
+
 class CardLogicQA:
     def __init__(self, cards: List[Dict[str, Any]], prompt_weights: Dict[str, float] = None):
         """cards: list of card dicts
@@ -22,6 +29,7 @@ class CardLogicQA:
         # initialize weights - default: ChineseQ preferred
         default = {k: (1.0 if k == 'ChineseQ' else 0.0) for k in self.keys}
         self.prompt_weights = default if prompt_weights is None else {**default, **prompt_weights}
+        self._build_candidates()
 
     def set_prompt_weights(self, weights: Dict[str, float]):
         """Replace or update prompt weights. Accepts partial dict of key->weight."""
@@ -31,52 +39,52 @@ class CardLogicQA:
                     self.prompt_weights[k] = float(v)
                 except Exception:
                     pass
-    def get_random_card(self) -> Dict[str, Any]:
-        """Select a random card and choose one of the six fields as the prompt.
+        self._build_candidates()
 
-        Returns a dict with 'card', 'prompt_key', and 'expected_keys'.
-        """
-        if not self.cards:
-            return None
+    def _build_candidates(self):
+        """Precompute each card's prompt keys and weights, and which cards can be drawn.
 
-        # choose a random card (try up to N attempts to find one with content)
-        attempts = 0
-        while attempts < 10:
-            self.current_idx = random.randint(0, len(self.cards) - 1)
-            self.current = self.cards[self.current_idx]
-            # available keys on this card
-            keys = self.keys
-
-            # build candidate prompt keys preserving configured weights and presence of content
+        Candidates are the keys with content and a positive weight; if a card has
+        none, any key with content is allowed with equal weight.
+        """
+        self._card_candidates: List[Tuple[List[str], List[float]]] = []
+        self._valid_idx: List[int] = []
+        for idx, card in enumerate(self.cards):
+            filled = [k for k in self.keys if card.get(k)]
             candidates = []
             weights = []
-            for k in keys:
-                if self.current.get(k):
-                    w = float(self.prompt_weights.get(k, 0.0) or 0.0)
-                    if w > 0:
-                        candidates.append(k)
-                        weights.append(w)
-
-            # if no weighted candidates (all weights zero or missing), fall back to any key that has content
+            for k in filled:
+                w = float(self.prompt_weights.get(k, 0.0) or 0.0)
+                if w > 0:
+                    candidates.append(k)
+                    weights.append(w)
+
             if not candidates:
-                candidates = [k for k in keys if self.current.get(k)]
-                weights = [1.0] * len(candidates)
+                candidates = filled
+                weights = [1.0] * len(filled)
 
+            self._card_candidates.append((candidates, weights))
             if candidates:
-                prompt_key = random.choices(candidates, weights=weights, k=1)[0]
-                break
-            attempts += 1
+                self._valid_idx.append(idx)
 
-        if not self.current:
+    def get_random_card(self) -> Dict[str, Any]:
+        """Select a random card and choose one of the six fields as the prompt.
+
+        Returns a dict with 'card', 'prompt_key', and 'expected_keys'.
+        """
+        if not self._valid_idx:
             return None
 
+        self.current_idx = random.choice(self._valid_idx)
+        self.current = self.cards[self.current_idx]
+        candidates, weights = self._card_candidates[self.current_idx]
+        prompt_key = random.choices(candidates, weights=weights, k=1)[0]
+
         # increment questioned counter
         self.current['questioned'] = self.current.get('questioned', 0) + 1
-        if self.current.get('_row') is not None:
-            self.current['_row']['Questioned'] = str(self.current['questioned'])
 
         # expected keys are the other five
-        expected_keys = [k for k in keys if k != prompt_key]
+        expected_keys = [k for k in self.keys if k != prompt_key]
 
         return {
             'card': self.current,
@@ -95,22 +103,18 @@ class CardLogicQA:
             return False, "No card loaded"
 
         failures = []
+        expected_low = self.current['_lc']
         for key in expected_keys:
-            expected = (self.current.get(key) or '').strip()
+            expected = self.current.get(key) or ''
             user = (user_answers.get(key) or '').strip()
 
-            # Normalize for comparison
-            exp_low = expected.lower()
+            # Normalize for comparison (expected values are lowercased at load)
+            exp_low = expected_low[key]
             user_low = user.lower()
 
-            ok = False
-            if not expected:
-                # no expected value, skip checking
-                ok = True
-            else:
-                # accept exact match or substring presence
-                if user_low == exp_low or exp_low in user_low or user_low in exp_low:
-                    ok = True
+            # no expected value: skip checking; otherwise accept exact match or
+            # substring presence
+            ok = not expected or _matches(user_low, exp_low)
 
             if not ok:
                 failures.append(f"{key}: expected '{expected}'")
@@ -118,8 +122,6 @@ class CardLogicQA:
         if not failures:
             # all correct
             self.current['correct'] = self.current.get('correct', 0) + 1
-            if self.current.get('_row') is not None:
-                self.current['_row']['Correct'] = str(self.current['correct'])
             return True, "All correct"
 
         return False, "; ".join(failures)
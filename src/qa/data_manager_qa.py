@@ -4,8 +4,10 @@ import csv
 import os
 from typing import List, Dict, Any
 
+from ..common.data_manager import CsvStore, read_rows_arrow, to_int, use_arrow
 
-class DataManagerQA:
+
+class DataManagerQA(CsvStore):
     """Loads QA CSV with six possible fields per row.
 
     The CSV may have slightly different header names. This loader attempts
@@ -19,8 +21,13 @@ class DataManagerQA:
     ]
 
     def __init__(self, csv_file: str):
-        self.csv_file = csv_file
+        super().__init__(csv_file)
         self.cards: List[Dict[str, Any]] = []
+        self.headers: List[str] = []
+        # canonical key -> CSV column it was read from (None if absent)
+        self.columns: Dict[str, Any] = {}
+        # card index -> values of CSV columns outside the canonical schema
+        self._extras: Dict[int, Dict[str, str]] = {}
 
     def _find_field(self, fieldnames, keyword):
         """Find a field name in fieldnames that contains the keyword (case-insensitive).
@@ -41,8 +48,9 @@ class DataManagerQA:
 
         try:
             with open(self.csv_file, encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames or []
+                reader = csv.reader(f)
+                fieldnames = next(reader, [])
+                self.headers = fieldnames
 
                 # Map canonical keys to actual CSV columns (if present)
                 mapping = {}
@@ -61,53 +69,64 @@ class DataManagerQA:
                     if k not in field_order:
                         field_order.append(k)
                 self.field_order = field_order
+                self.columns = mapping
+
+                known = {name for name in mapping.values() if name} | {'Questioned', 'Correct'}
+
+                # Resolve column positions once; rows are read by index
+                col = {name: i for i, name in enumerate(fieldnames)}
+                key_cols = [(k, col[mapping[k]] if mapping[k] else None) for k in self.CANONICAL_KEYS]
+                q_i, c_i = col.get('Questioned'), col.get('Correct')
+                extra_cols = [(f, i) for f, i in col.items() if f not in known]
+                width = len(fieldnames)
+
+                if fieldnames and use_arrow(self.csv_file):
+                    reader = read_rows_arrow(self.csv_file, fieldnames) or reader
 
                 for row in reader:
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+
                     # Build card with canonical keys
-                    card = {'_row': row}
-                    for k in self.CANONICAL_KEYS:
-                        col = mapping.get(k)
-                        card[k] = (row.get(col) or '').strip() if col else ''
+                    card = {k: row[i].strip() if i is not None else '' for k, i in key_cols}
 
                     # Counters
-                    try:
-                        questioned_val = int(row.get('Questioned') or 0)
-                    except Exception:
-                        questioned_val = 0
-                    try:
-                        correct_val = int(row.get('Correct') or 0)
-                    except Exception:
-                        correct_val = 0
-
-                    card['questioned'] = questioned_val
-                    card['correct'] = correct_val
+                    card['questioned'] = to_int(row[q_i]) if q_i is not None else 0
+                    card['correct'] = to_int(row[c_i]) if c_i is not None else 0
+                    # lowercased expected answers for CardLogicQA.check_answer
+                    card['_lc'] = {k: card[k].lower() for k in self.CANONICAL_KEYS}
 
                     # Skip rows without any question content
                     if not any(card[k] for k in ['ChineseQ', 'JyutpingQ', 'EnglishQ']):
                         continue
 
+                    extras = {f: row[i] for f, i in extra_cols if row[i]}
+                    if extras:
+                        self._extras[len(self.cards)] = extras
                     self.cards.append(card)
             return True
         except Exception as e:
             print(f"Error loading QA CSV: {e}")
             return False
 
-    def save_csv(self):
-        try:
-            with open(self.csv_file, encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                headers = reader.fieldnames or []
-
-            with open(self.csv_file, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=headers, extrasaction='ignore', restval='')
-                writer.writeheader()
-                for c in self.cards:
-                    row = c.get('_row', {}) or {}
-                    row['Questioned'] = str(c.get('questioned', 0))
-                    row['Correct'] = str(c.get('correct', 0))
-                    writer.writerow(row)
-        except Exception as e:
-            print(f"Error saving QA CSV: {e}")
+    def get_rows(self) -> List[Dict[str, str]]:
+        """Snapshot the current cards as CSV rows keyed by header name."""
+        rows = []
+        for i, c in enumerate(self.cards):
+            row = dict(self._extras.get(i, {}))
+            for k, col in self.columns.items():
+                if col:
+                    row[col] = c[k]
+            row['Questioned'] = str(c.get('questioned', 0))
+            row['Correct'] = str(c.get('correct', 0))
+            rows.append(row)
+        return rows
+
+    def write_csv(self, f, rows: List[Dict[str, str]]):
+        headers = self.headers or self.CANONICAL_KEYS + ['Questioned', 'Correct']
+        writer = csv.DictWriter(f, fieldnames=headers, extrasaction='ignore', restval='')
+        writer.writeheader()
+        writer.writerows(rows)
 
     def get_cards(self) -> List[Dict[str, Any]]:
         return self.cards
@@ -1,31 +1,73 @@
 """Simple QA flashcard app window using the QA data manager and logic."""
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QMessageBox, QLabel, QHBoxLayout, QPushButton
-from PyQt5.QtMultimedia import QSound
+from PyQt5.QtCore import QTimer, pyqtSignal
 import re
 
 # Chinese regex used by the TTS generator
 CHINESE_RE = re.compile(r'[\u4E00-\u9FFF\u3400-\u4DBF\uF900-\uFAFF]+')
-import threading
-import shutil
-import subprocess
-
-from ..common.ui_widgets import InputField, ControlButtons
+import functools
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from ..common.ui_widgets import InputField, ControlButtons, SoundCache
+from ..common.save_worker import BackgroundSaver
+from ..common.audio import AUDIO_DIR, SAFE_RE, index_audio_dir
 from .data_manager_qa import DataManagerQA
 from .card_logic_qa import CardLogicQA
 from pathlib import Path
 
 
 MAX_CARDS = 10
+# How long "correct" feedback stays up before the next card; corrections
+# for wrong answers stay until the user presses Enter or Next
+FEEDBACK_DELAY_MS = 600
+# Concurrent ekho processes when synthesising missing audio
+TTS_WORKERS = 2
+
+
+def safe_name(text: str) -> str:
+    # prefer extracting pure Chinese characters (generator uses Chinese-only matches)
+    if not text:
+        return ''
+    m = CHINESE_RE.findall(text)
+    return ''.join(m) if m else SAFE_RE.sub('_', text)
+
+
+@functools.lru_cache(maxsize=4096)
+def audio_path_for_text(text: str) -> Path:
+    """Return the audio file for text; cached since the same texts recur all session."""
+    return AUDIO_DIR / f"{safe_name(text)}.wav"
 
 
 class FlashcardQAApp(QWidget):
+    # emitted from TTS worker threads: (audio path, generated successfully)
+    tts_finished = pyqtSignal(str, bool)
+
     def __init__(self, csv_file: str):
         super().__init__()
         self.csv_file = csv_file
         self.data_manager = DataManagerQA(csv_file)
         self.card_logic = None
         self.card_count = 0
+        # pop up a dialog after each answer instead of the inline status line
+        self.show_modal_feedback = False
+        # a wrong answer's correction is showing; Enter moves on instead of re-checking
+        self._showing_correction = False
+        # audio files known to exist, so repeat plays skip the stat call
+        self._audio_exists = set()
+        # loaded clips, so replays don't decode the WAV again
+        self._sound_cache = SoundCache(self)
+        # one job per missing file, however many times Listen is clicked
+        self._tts_pool = ThreadPoolExecutor(max_workers=TTS_WORKERS)
+        self._tts_inflight: Dict[Path, Future] = {}
+        # in-flight files the user asked to hear (warmup jobs play silently)
+        self._tts_play_requested = set()
+        self.tts_finished.connect(self.on_tts_finished)
+        # resolved on first use: None = not looked up yet, '' = not installed
+        self._ekho_path: Optional[str] = None
+        self.saver = BackgroundSaver(self.data_manager, parent=self)
 
         if not self.data_manager.load_csv():
             QMessageBox.critical(self, "Error", "Failed to load QA CSV file")
@@ -37,8 +79,17 @@ class FlashcardQAApp(QWidget):
 
         self.cards = self.data_manager.get_cards()
         self.card_logic = CardLogicQA(self.cards)
+        self.prewarm_audio()
         self.init_ui()
 
+    def closeEvent(self, event):
+        self.saver.stop()
+        # drop queued warmup jobs; otherwise interpreter exit waits for all of them
+        for future in self._tts_inflight.values():
+            future.cancel()
+        self._tts_pool.shutdown(wait=False)
+        super().closeEvent(event)
+
     def init_ui(self):
         self.setWindowTitle("Cantonese QA Flashcards")
         self.resize(700, 300)
@@ -67,6 +118,17 @@ class FlashcardQAApp(QWidget):
                 fld._listen_button = btn_listen
             self.input_fields[key] = (lbl, fld, h)
             layout.addLayout(h)
+        # flat (key, field) pairs walked on every card
+        self._field_items = [(key, fld) for key, (_lbl, fld, _h) in self.input_fields.items()]
+
+        # Inline feedback for the last answer
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        self.advance_timer = QTimer(self)
+        self.advance_timer.setSingleShot(True)
+        self.advance_timer.setInterval(FEEDBACK_DELAY_MS)
+        self.advance_timer.timeout.connect(self.advance)
 
         # Buttons
         self.buttons = ControlButtons(on_check_callback=self.check, on_next_callback=self.new_card)
@@ -77,6 +139,11 @@ class FlashcardQAApp(QWidget):
         self.new_card()
 
     def new_card(self):
+        # Next pressed while feedback was showing: don't advance twice
+        self.advance_timer.stop()
+        self.status_label.clear()
+        self._showing_correction = False
+
         if self.card_count >= MAX_CARDS:
             self.ask_continue()
             return
@@ -86,6 +153,10 @@ class FlashcardQAApp(QWidget):
             QMessageBox.critical(self, "Error", "Failed to get card")
             return
 
+        # drawing a card bumps its questioned counter
+        self.data_manager.mark_dirty()
+        self.saver.request_save()
+
         card = res['card']
         prompt_key = res.get('prompt_key')
         expected_keys = res.get('expected_keys', [])
@@ -95,22 +166,13 @@ class FlashcardQAApp(QWidget):
         self.current_expected_keys = expected_keys
         self.current_prompt_val = prompt_val
 
-        # configure inputs: always show all 6 fields; prefill & disable prompted field
-        for key, (lbl, fld, h) in self.input_fields.items():
-            lbl.show()
+        # configure inputs: prefill & disable the prompted field, clear the rest
+        # (labels and listen buttons stay visible throughout)
+        for key, fld in self._field_items:
             if key == prompt_key:
-                # pre-fill and grey out
-                fld.disable(prompt_val or '')
-                if hasattr(fld, '_listen_button'):
-                    # prompt listen should play the expected prompt (use prompt_listen_button too)
-                    fld._listen_button.show()
+                fld.disable(prompt_val)
             else:
-                # reset/enable other fields for answers
                 fld.enable()
-                # ensure input is empty
-                fld.clear()
-                if hasattr(fld, '_listen_button'):
-                    fld._listen_button.show()
 
         self.card_count += 1
 
@@ -118,21 +180,36 @@ class FlashcardQAApp(QWidget):
         # gather user answers for expected keys
         # use stored expected keys from last new_card
         current = self.card_logic.current
-        if not current:
+        if not current or self.advance_timer.isActive():
+            return
+        if self._showing_correction:
+            self.advance()
             return
         expected_keys = getattr(self, 'current_expected_keys', [])
-        user_answers = {}
-        for k in expected_keys:
-            user_answers[k] = self.input_fields[k][1].text().strip()
+        user_answers = {k: self.input_fields[k][1].text().strip() for k in expected_keys}
 
         correct, msg = self.card_logic.check_answer(user_answers, expected_keys)
-        self.data_manager.save_csv()
+        if correct:
+            self.data_manager.mark_dirty()
+
+        self.saver.request_save()
+
+        if self.show_modal_feedback:
+            if correct:
+                QMessageBox.information(self, "Correct", msg)
+            else:
+                QMessageBox.warning(self, "Incorrect", msg)
+            self.advance()
+            return
 
+        self.status_label.setStyleSheet("color: green;" if correct else "color: red;")
+        self.status_label.setText(msg)
         if correct:
-            QMessageBox.information(self, "Correct", msg)
+            self.advance_timer.start()
         else:
-            QMessageBox.warning(self, "Incorrect", msg)
+            self._showing_correction = True
 
+    def advance(self):
         if self.card_count < MAX_CARDS:
             self.new_card()
         else:
@@ -151,19 +228,10 @@ class FlashcardQAApp(QWidget):
             self.close()
 
     def safe_name(self, text: str) -> str:
-        # prefer extracting pure Chinese characters (generator uses Chinese-only matches)
-        if not text:
-            return ''
-        m = CHINESE_RE.findall(text)
-        if m:
-            base = ''.join(m)
-        else:
-            base = ''.join(ch if ch.isalnum() else '_' for ch in text)
-        return base
+        return safe_name(text)
 
     def get_audio_path_for_text(self, text: str) -> Path:
-        safe = self.safe_name(text)
-        return Path('resources') / 'audio' / f"{safe}.wav"
+        return audio_path_for_text(text)
 
     def generate_audio_and_play(self, text: str):
         """Ensure audio exists for text: generate via ekho in background if missing and play when ready."""
@@ -172,36 +240,89 @@ class FlashcardQAApp(QWidget):
             return
 
         out_path = self.get_audio_path_for_text(text)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if out_path.exists():
+        if out_path in self._tts_inflight:
+            # already being generated; play it as soon as it is ready
+            self._tts_play_requested.add(out_path)
+            return
+
+        if out_path in self._audio_exists or out_path.exists():
+            self._audio_exists.add(out_path)
             try:
-                QSound.play(str(out_path))
+                self._sound_cache.play(out_path)
             except Exception as e:
                 QMessageBox.warning(self, "Playback Error", str(e))
             return
 
         # Need to generate. Check ekho availability
-        if not shutil.which('ekho'):
+        if not self.ekho_path():
             QMessageBox.warning(self, "Missing ekho", "ekho command not found on PATH; cannot synthesize audio")
             return
 
+        # Inform user and start background generation
+        QMessageBox.information(self, "Generating audio", f"Generating audio for: {text}")
+        self._tts_play_requested.add(out_path)
+        self.submit_tts(text, out_path)
+
+    def prewarm_audio(self):
+        """Queue generation of every missing Chinese prompt/answer clip in the deck."""
+        # one directory scan up front so Listen clicks rarely need to stat
+        self._audio_exists.update(index_audio_dir().values())
+        if not self.ekho_path():
+            return
+        for card in self.cards:
+            for key in ('ChineseQ', 'ChineseA'):
+                text = card.get(key)
+                if not text:
+                    continue
+                out_path = self.get_audio_path_for_text(text)
+                if out_path not in self._audio_exists and out_path not in self._tts_inflight:
+                    self.submit_tts(text, out_path)
+
+    def ekho_path(self) -> str:
+        """Return the ekho executable, or '' if it is not on PATH."""
+        if self._ekho_path is None:
+            import shutil
+            self._ekho_path = shutil.which('ekho') or ''
+        return self._ekho_path
+
+    def submit_tts(self, text: str, out_path: Path):
+        import subprocess
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # ekho creates its output file as soon as it starts, so write elsewhere
+        # and only move a complete clip into place
+        tmp_path = out_path.with_suffix('.wav.tmp')
+
         def worker():
-            cmd = ['ekho', '-v', 'Cantonese', '-o', str(out_path), text]
+            cmd = [self._ekho_path, '-v', 'Cantonese', '-o', str(tmp_path), text]
+            ok = False
             try:
                 subprocess.run(cmd, check=True)
-                # play the generated file
-                try:
-                    QSound.play(str(out_path))
-                except Exception:
-                    pass
+                os.replace(tmp_path, out_path)
+                ok = True
             except Exception as e:
                 print('ekho generation failed:', e)
-
-        # Inform user and start background generation
-        QMessageBox.information(self, "Generating audio", f"Generating audio for: {text}")
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            # hand back to the GUI thread, which owns playback and the bookkeeping
+            self.tts_finished.emit(str(out_path), ok)
+
+        self._tts_inflight[out_path] = self._tts_pool.submit(worker)
+
+    def on_tts_finished(self, path: str, ok: bool):
+        out_path = Path(path)
+        self._tts_inflight.pop(out_path, None)
+        play = out_path in self._tts_play_requested
+        self._tts_play_requested.discard(out_path)
+        if not ok:
+            return
+        self._audio_exists.add(out_path)
+        if play:
+            try:
+                self._sound_cache.play(out_path)
+            except Exception:
+                pass
 
     def play_field_audio(self, field: InputField):
         # Deprecated: field playback is not used. Keep for compatibility.
@@ -210,11 +331,11 @@ class FlashcardQAApp(QWidget):
             QMessageBox.warning(self, "No Text", "No text to play")
             return
         p = self.get_audio_path_for_text(text)
-        if not p.exists():
+        if p not in self._audio_exists and not p.exists():
             QMessageBox.warning(self, "No Audio", f"Audio not found: {p}")
             return
         try:
-            QSound.play(str(p))
+            self._sound_cache.play(p)
         except Exception as e:
             QMessageBox.warning(self, "Playback Error", str(e))
 